@@ -42,3 +42,25 @@ class ComputeOutputSpecTest(unittest.TestCase):
             three_args_2_kwarg_test_fn, x1, x2, x3=x3
         )
         self.assertEqual(y.shape, (None, 5))
+
+    def test_dynamic_shape_scalar_output(self):
+        x = KerasTensor(shape=(None, 3))
+        y = backend.compute_output_spec(backend.numpy.sum, x)
+        self.assertEqual(y.shape, ())
+
+    @unittest.skipIf(
+        backend.backend() != "torch",
+        reason="Only the torch backend traces `fn` once per fill value.",
+    )
+    def test_dynamic_shape_scalar_output_single_trace(self):
+        calls = []
+
+        def fn(x):
+            calls.append(x)
+            return backend.numpy.sum(x), None
+
+        x = KerasTensor(shape=(None, 3))
+        y, none = backend.compute_output_spec(fn, x)
+        self.assertEqual(y.shape, ())
+        self.assertIsNone(none)
+        self.assertEqual(len(calls), 1)
@@ -1,4 +1,6 @@
+import builtins
 import contextlib
+import functools
 import os
 
 import numpy as np
@@ -54,25 +56,91 @@ def device_scope(device):
 
 
 def get_device():
-    device = global_state.get_global_attribute("torch_device", None)
-    if device is None:
-        return DEFAULT_DEVICE
-    return device
+    return global_state.get_global_attribute("torch_device", DEFAULT_DEVICE)
 
 
-def to_torch_dtype(dtype):
+def _to_torch_dtype(dtype):
     standardized_dtype = TORCH_DTYPES.get(standardize_dtype(dtype), None)
     if standardized_dtype is None:
         raise ValueError(f"Unsupported dtype for PyTorch: {dtype}")
     return standardized_dtype
 
 
+@functools.lru_cache
+def _str_to_torch_dtype(dtype):
+    return _to_torch_dtype(dtype)
+
+
+# Canonical dtype names and torch dtypes, which resolve without standardizing.
+_TORCH_DTYPES_FAST = {
+    **TORCH_DTYPES,
+    **{dtype: dtype for dtype in TORCH_DTYPES.values()},
+}
+
+
+def to_torch_dtype(dtype):
+    torch_dtype = _TORCH_DTYPES_FAST.get(dtype, None)
+    if torch_dtype is not None:
+        return torch_dtype
+    if isinstance(dtype, str):
+        return _str_to_torch_dtype(dtype)
+    return _to_torch_dtype(dtype)
+
+
+@functools.lru_cache
+def _element_size(dtype):
+    return torch.empty([], dtype=dtype, device="meta").element_size()
+
+
+@functools.lru_cache
+def _parse_torch_device(device):
+    return torch.device(device)
+
+
+def _to_torch_device(device):
+    device = _parse_torch_device(device)
+    if device.index is None:
+        # Resolve the device that `.to()` would pick for an index-less
+        # accelerator, so it can be compared with `Tensor.device`.
+        if device.type == "cuda":
+            return torch.device("cuda", torch.cuda.current_device())
+        if device.type == "mps":
+            return torch.device("mps", 0)
+    return device
+
+
+def _is_on_device(x, device):
+    return x.device == device
+
+
+def _smart_to(x, device, dtype=None):
+    """Move `x` to `device` and cast it to `dtype`.
+
+    The cast is done on whichever side of the transfer holds the narrower
+    dtype, so that the fewest bytes are copied between devices.
+    """
+    device = _to_torch_device(device)
+    if dtype is None or x.dtype == dtype:
+        if _is_on_device(x, device):
+            # Nothing to do, which is the common case.
+            return x
+        return x.to(device)
+    if _element_size(dtype) > _element_size(x.dtype):
+        return x.to(device).to(dtype)
+    return x.to(dtype).to(device)
+
+
 class Variable(KerasVariable):
     def _initialize(self, value):
+        if isinstance(value, KerasVariable):
+            # `convert_to_tensor` returns variable values as-is, so unwrap
+            # them to have them moved to the current device.
+            value = value.value
+        # `convert_to_tensor` places tensors on the current device.
         self._value = torch.nn.Parameter(
             convert_to_tensor(value, dtype=self._dtype),
             requires_grad=self.trainable,
-        ).to(get_device())
+        )
 
     def _direct_assign(self, value):
         with torch.no_grad():
@@ -84,15 +152,19 @@ class Variable(KerasVariable):
     # Overload native accessor.
     @classmethod
     def __torch_function__(cls, func, types, args=(), kwargs=None):
-        args = [
-            arg.value if isinstance(arg, KerasVariable) else arg for arg in args
-        ]
         if kwargs is None:
             kwargs = {}
-        kwargs = {
-            key: value.value if isinstance(value, KerasVariable) else value
-            for key, value in kwargs.items()
-        }
+        # Only rebuild the arguments when there is a variable to unwrap.
+        if any(isinstance(arg, KerasVariable) for arg in args):
+            args = [
+                arg.value if isinstance(arg, KerasVariable) else arg
+                for arg in args
+            ]
+        if any(isinstance(value, KerasVariable) for value in kwargs.values()):
+            kwargs = {
+                key: value.value if isinstance(value, KerasVariable) else value
+                for key, value in kwargs.items()
+            }
         return func(*args, **kwargs)
 
     def __array__(self, dtype=None):
@@ -124,12 +196,9 @@ def convert_to_tensor(x, dtype=None, sparse=False):
     if sparse:
         raise ValueError("`sparse=True` is not supported with torch backend")
     if is_tensor(x):
-        device = get_device()
-        if x.device != device:
-            x = x.to(device)
-        if dtype is None:
-            return x
-        return x.to(to_torch_dtype(dtype))
+        if dtype is not None:
+            dtype = to_torch_dtype(dtype)
+        return _smart_to(x, get_device(), dtype)
     if isinstance(x, Variable):
         # TorchDynamo has bugs supporting nn.Parameter type check.
         # Return it directly instead of pass it to the rest of the logic in the
@@ -144,13 +213,35 @@ def convert_to_tensor(x, dtype=None, sparse=False):
         x = np.array(x)
     elif len(x) > 0 and any(isinstance(x1, torch.Tensor) for x1 in x):
         # Handle list or tuple of torch tensors
-        return torch.stack([convert_to_tensor(x1) for x1 in x])
+        if dtype is not None:
+            dtype = to_torch_dtype(dtype)
+        if all(is_tensor(x1) and x1.device == x[0].device for x1 in x):
+            # Stack on the source device and transfer the result once,
+            # instead of moving every element separately.
+            return _smart_to(torch.stack(x), get_device(), dtype)
+        # Python scalars ignore `dtype` in `convert_to_tensor`, so cast the
+        # stacked result instead of the individual elements.
+        x = torch.stack([convert_to_tensor(x1) for x1 in x])
+        return _smart_to(x, get_device(), dtype)
     if isinstance(x, np.ndarray):
         if x.dtype == np.uint32:
             # Torch backend does not support uint32.
             x = x.astype(np.int64)
         dtype = dtype or x.dtype
     dtype = to_torch_dtype(dtype)
+    if isinstance(x, (list, tuple)):
+        # Parse nested Python sequences into a single contiguous host buffer
+        # with NumPy, which then needs only one copy to the device.
+        try:
+            array = np.asarray(x)
+        except (TypeError, RuntimeError, ValueError):
+            # Nested sequences may hold tensors that NumPy can't read (e.g.
+            # on an accelerator or requiring grad); let torch parse those.
+            array = None
+        # Only keep numeric results, so that `None` or string elements are
+        # still rejected by torch instead of being coerced by NumPy.
+        if array is not None and array.dtype.kind in "biuf":
+            x = array
     return torch.as_tensor(x, dtype=dtype, device=get_device())
 
 
@@ -161,7 +252,9 @@ def convert_to_numpy(x):
                 x = x.detach()
             # Tensor has to be moved to CPU before converting to numpy.
             if x.is_cuda or x.is_mps:
-                x = x.cpu()
+                # `cpu()` already returns a fresh host copy, so wrap it
+                # without copying it a second time.
+                return x.cpu().numpy()
         return np.array(x)
 
     if isinstance(x, (list, tuple)):
@@ -179,13 +272,14 @@ def shape(x):
 
 def cast(x, dtype):
     dtype = to_torch_dtype(dtype)
-    if isinstance(x, KerasVariable):
-        x = x.value
     if is_tensor(x):
+        # Casting keeps tensors on their current device.
         if x.dtype == dtype:
             return x
         else:
             return x.to(dtype)
+    if isinstance(x, KerasVariable):
+        return cast(x.value, dtype)
     return convert_to_tensor(x, dtype)
 
 
@@ -197,6 +291,12 @@ def compute_output_spec(fn, *args, **kwargs):
             return None in x.shape
         return False
 
+    def has_dims(x):
+        """Check for if a `torch.Tensor` has at least one dimension."""
+        if is_tensor(x):
+            return x.ndim > 0
+        return False
+
     def convert_keras_tensor_to_torch(x, fill_value=None):
         """Convert `KerasTensor`s to `torch.Tensor`s."""
         if isinstance(x, KerasTensor):
@@ -218,38 +318,46 @@ def compute_output_spec(fn, *args, **kwargs):
             return KerasTensor(x.shape, standardize_dtype(x.dtype))
         return x
 
+    use_meta_device = True
+
     def symbolic_call(fn, args, kwargs, fill_value):
         """Call `fn` to infer output shape and dtype."""
-        try:
-            # First try instantiating all tensors on the `"meta"` device,
-            # which  should give a "zero flop" way to trace shape, but does
-            # not have universal support with torch operations.
-            with device_scope("meta"):
-                meta_args, meta_kwargs = tree.map_structure(
-                    lambda x: convert_keras_tensor_to_torch(x, fill_value),
-                    (args, kwargs),
-                )
-                return fn(*meta_args, **meta_kwargs)
-        except:
-            with device_scope(DEFAULT_DEVICE):
-                # If the `"meta"` device placement fails, fall back to tracing
-                # eagerly with tensors on the default device. This will be
-                # more robust, but more expensive.
-                eager_args, eager_kwargs = tree.map_structure(
-                    lambda x: convert_keras_tensor_to_torch(x, fill_value),
-                    (args, kwargs),
-                )
-                return fn(*eager_args, **eager_kwargs)
+        nonlocal use_meta_device
+        if use_meta_device:
+            try:
+                # First try instantiating all tensors on the `"meta"` device,
+                # which  should give a "zero flop" way to trace shape, but does
+                # not have universal support with torch operations.
+                with device_scope("meta"):
+                    meta_args, meta_kwargs = tree.map_structure(
+                        lambda x: convert_keras_tensor_to_torch(x, fill_value),
+                        (args, kwargs),
+                    )
+                    return fn(*meta_args, **meta_kwargs)
+            except:
+                # `fn` is not supported on the `"meta"` device, so don't
+                # attempt it again when tracing with another fill value.
+                use_meta_device = False
+        with device_scope(DEFAULT_DEVICE):
+            # If the `"meta"` device placement fails, fall back to tracing
+            # eagerly with tensors on the default device. This will be
+            # more robust, but more expensive.
+            eager_args, eager_kwargs = tree.map_structure(
+                lambda x: convert_keras_tensor_to_torch(x, fill_value),
+                (args, kwargs),
+            )
+            return fn(*eager_args, **eager_kwargs)
 
     with StatelessScope(), torch.no_grad():
-        outputs = symbolic_call(fn, args, kwargs, fill_value=83)
+        outputs_1 = symbolic_call(fn, args, kwargs, fill_value=83)
+        flat_out_1 = tree.flatten(outputs_1)
 
         none_in_shape = any(map(has_none_shape, tree.flatten((args, kwargs))))
-        if none_in_shape:
-            outputs_1 = outputs
+        # A second trace is only needed to find out which output dimensions
+        # depend on the dynamic input dimensions, so skip it when there are
+        # no output dimensions to disambiguate (e.g. scalar outputs).
+        if none_in_shape and any(map(has_dims, flat_out_1)):
             outputs_2 = symbolic_call(fn, args, kwargs, fill_value=89)
-
-            flat_out_1 = tree.flatten(outputs_1)
             flat_out_2 = tree.flatten(outputs_2)
 
             flat_out = []
@@ -259,9 +367,11 @@ def compute_output_spec(fn, *args, **kwargs):
                     if e != shape[i]:
                         shape[i] = None
                 flat_out.append(KerasTensor(shape, standardize_dtype(x1.dtype)))
-            outputs = pack_sequence_as(outputs_1, flat_out)
-
-        output_spec = tree.map_structure(convert_torch_to_keras_tensor, outputs)
+        else:
+            flat_out = [convert_torch_to_keras_tensor(x) for x in flat_out_1]
+        # Pack the flat outputs directly into `outputs_1`'s structure rather
+        # than walking the structure again.
+        output_spec = pack_sequence_as(outputs_1, flat_out)
     return output_spec
 
 
@@ -280,7 +390,7 @@ def vectorized_map(function, elements):
 
 
 def scatter(indices, values, shape):
-    indices = convert_to_tensor(indices)
+    indices = convert_to_tensor(indices, dtype="int64")
     values = convert_to_tensor(values)
     zeros = torch.zeros(shape, dtype=values.dtype, device=get_device())
 
@@ -289,9 +399,9 @@ def scatter(indices, values, shape):
     indices = torch.reshape(indices, [-1, index_length])
     values = torch.reshape(values, [-1] + list(value_shape))
 
-    for i in range(indices.shape[0]):
-        index = indices[i]
-        zeros[tuple(index)] += values[i]
+    # Accumulate all updates in a single scatter-add instead of looping over
+    # the indices in Python.
+    zeros.index_put_(tuple(indices.unbind(dim=1)), values, accumulate=True)
     return zeros
 
 
@@ -299,35 +409,38 @@ def scatter_update(inputs, indices, updates):
     inputs = convert_to_tensor(inputs)
     indices = convert_to_tensor(indices, dtype="int64")
     updates = convert_to_tensor(updates)
-    indices = torch.transpose(indices, 0, 1)
 
-    inputs[tuple(indices)] = updates
+    inputs.index_put_(tuple(indices.unbind(-1)), updates)
     return inputs
 
 
+def _to_python_ints(x):
+    # Resolve indices on the host in a single transfer rather than syncing on
+    # every element of a device tensor.
+    if is_tensor(x):
+        x = x.tolist()
+    return [int(e) for e in x]
+
+
 def slice(inputs, start_indices, shape):
-    shape_dtype = to_torch_dtype("int64")
     inputs = convert_to_tensor(inputs)
-    start_indices = convert_to_tensor(start_indices).to(shape_dtype)
-    shape = convert_to_tensor(shape).to(shape_dtype)
+    start_indices = _to_python_ints(start_indices)
+    shape = _to_python_ints(shape)
 
-    python_slice = __builtins__["slice"]
     slices = [
-        python_slice(start_index, start_index + length)
+        builtins.slice(start_index, start_index + length)
         for start_index, length in zip(start_indices, shape)
     ]
     return inputs[slices]
 
 
 def slice_update(inputs, start_indices, updates):
-    shape_dtype = to_torch_dtype("int64")
     inputs = convert_to_tensor(inputs)
-    start_indices = convert_to_tensor(start_indices).to(shape_dtype)
+    start_indices = _to_python_ints(start_indices)
     updates = convert_to_tensor(updates)
 
-    python_slice = __builtins__["slice"]
     slices = [
-        python_slice(start_index, start_index + update_length)
+        builtins.slice(start_index, start_index + update_length)
         for start_index, update_length in zip(start_indices, updates.shape)
     ]
     outputs = torch.clone(inputs)
@@ -342,15 +455,18 @@ def while_loop(
     maximum_iterations=None,
 ):
     current_iter = 0
-    iteration_check = (
-        lambda iter: maximum_iterations is None or iter < maximum_iterations
-    )
+    if maximum_iterations is None:
+        maximum_iterations = float("inf")
     loop_vars = tuple([convert_to_tensor(v) for v in loop_vars])
-    while cond(*loop_vars) and iteration_check(current_iter):
+    # Check the iteration bound first so that `cond` is not evaluated one
+    # extra time once `maximum_iterations` has been reached.
+    while current_iter < maximum_iterations and cond(*loop_vars):
         loop_vars = body(*loop_vars)
-        if not isinstance(loop_vars, (list, tuple)):
-            loop_vars = (loop_vars,)
-        loop_vars = tuple(loop_vars)
+        if type(loop_vars) is not tuple:
+            if isinstance(loop_vars, (list, tuple)):
+                loop_vars = tuple(loop_vars)
+            else:
+                loop_vars = (loop_vars,)
         current_iter += 1
     return loop_vars
 
@@ -363,9 +479,13 @@ def fori_loop(lower, upper, body_fun, init_val):
 
 
 def stop_gradient(variable):
+    if isinstance(variable, KerasVariable):
+        variable = variable.value
     # We can't use `.requires_grad_(False)` here since it only
     # works when the tensor is a leaf node in the graph.
-    return variable.detach()
+    if is_tensor(variable):
+        return variable.detach()
+    return variable
 
 
 def unstack(x, num=None, axis=0):
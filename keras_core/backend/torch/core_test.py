@@ -0,0 +1,36 @@
+import types
+
+import torch
+
+from keras_core.backend.torch.core import _is_on_device
+from keras_core.backend.torch.core import _to_torch_device
+from keras_core.backend.torch.core import cast
+from keras_core.backend.torch.core import device_scope
+from keras_core.testing import TestCase
+
+
+class TorchDeviceTest(TestCase):
+    def test_is_on_device(self):
+        x = types.SimpleNamespace(device=torch.device("cuda", 1))
+        self.assertTrue(_is_on_device(x, torch.device("cuda", 1)))
+        self.assertFalse(_is_on_device(x, torch.device("cuda", 0)))
+        # An index-less device is not a match for every index.
+        self.assertFalse(_is_on_device(x, torch.device("cuda")))
+
+        x = types.SimpleNamespace(device=torch.device("cpu"))
+        self.assertTrue(_is_on_device(x, torch.device("cpu")))
+        self.assertFalse(_is_on_device(x, torch.device("meta")))
+
+    def test_to_torch_device(self):
+        self.assertEqual(_to_torch_device("cpu"), torch.device("cpu"))
+        self.assertEqual(_to_torch_device("meta"), torch.device("meta"))
+        self.assertEqual(_to_torch_device("cuda:1"), torch.device("cuda", 1))
+        self.assertEqual(_to_torch_device("mps"), torch.device("mps", 0))
+
+    def test_cast_keeps_device(self):
+        x = torch.ones((2,), dtype=torch.float32, device="cpu")
+        with device_scope("meta"):
+            for dtype in ["float32", "float16", "int32"]:
+                y = cast(x, dtype)
+                self.assertEqual(y.device, torch.device("cpu"))
+                self.assertEqual(y.dtype, getattr(torch, dtype))
@@ -1,3 +1,5 @@
+import collections
+
 import numpy as np
 import pytest
 
@@ -176,6 +178,24 @@ class CoreOpsCorrectnessTest(testing.TestCase):
         expected = np.broadcast_to(np.arange(1, 5), (1, 2, 3, 4))
         self.assertAllClose(outputs, expected)
 
+    def test_slice_tensor_start_indices(self):
+        inputs = np.broadcast_to(np.arange(10), (4, 10))
+        start_indices = ops.convert_to_tensor([1, 1])
+        shape = ops.convert_to_tensor([2, 4])
+        self.assertAllClose(
+            core.slice(inputs, start_indices, shape),
+            [[1, 2, 3, 4], [1, 2, 3, 4]],
+        )
+
+        if backend.backend() == "torch":
+            # Float indices are truncated to integers.
+            start_indices = ops.convert_to_tensor([1.0, 1.0], dtype="float32")
+            shape = ops.convert_to_tensor([2.0, 4.0], dtype="float32")
+            self.assertAllClose(
+                core.slice(inputs, start_indices, shape),
+                [[1, 2, 3, 4], [1, 2, 3, 4]],
+            )
+
     def test_dynamic_slice(self):
         def cond(index, inputs, sum):
             return index < 10
@@ -215,6 +235,20 @@ class CoreOpsCorrectnessTest(testing.TestCase):
         outputs = core.slice_update(inputs, start_indices, updates)
         self.assertAllClose(outputs[1:3, 1:3, 2:4, 2:4], np.zeros([2, 2, 2, 2]))
 
+    def test_slice_update_tensor_start_indices(self):
+        inputs = np.array([[1, 1], [1, 1], [1, 1]])
+        updates = np.array([[2, 2], [2, 2]])
+        start_indices_list = [ops.convert_to_tensor([1, 0])]
+        if backend.backend() == "torch":
+            start_indices_list.append(
+                ops.convert_to_tensor([1.0, 0.0], dtype="float32")
+            )
+        for start_indices in start_indices_list:
+            self.assertAllClose(
+                core.slice_update(inputs, start_indices, updates),
+                [[1, 1], [2, 2], [2, 2]],
+            )
+
     def test_while_loop(self):
         def cond(x, y):
             return x[0, 0] < 10
@@ -234,6 +268,25 @@ class CoreOpsCorrectnessTest(testing.TestCase):
         self.assertAllClose(x, np.ones((2, 3)) * 6)
         self.assertAllClose(y, np.ones((3, 2)) * 6)
 
+    @pytest.mark.skipif(
+        backend.backend() == "tensorflow",
+        reason="`tf.while_loop` requires `body` to keep the loop structure.",
+    )
+    def test_while_loop_namedtuple_body(self):
+        State = collections.namedtuple("State", ["x", "y"])
+
+        def cond(x, y):
+            return x[0, 0] < 10
+
+        def body(x, y):
+            return State(x + 1, y + 1)
+
+        x = np.ones((2, 3))
+        y = np.ones((3, 2))
+        x, y = core.while_loop(cond, body, (x, y))
+        self.assertAllClose(x, np.ones((2, 3)) * 10)
+        self.assertAllClose(y, np.ones((3, 2)) * 10)
+
     def test_fori_loop(self):
         def body_fun(i, x):
             return x + i
@@ -269,6 +322,18 @@ class CoreOpsCorrectnessTest(testing.TestCase):
         y = ops.stop_gradient(x)
         self.assertAllClose(x, y)
 
+    def test_stop_gradient_variable(self):
+        v = backend.Variable(np.ones((2, 3)), dtype="float32")
+        y = ops.stop_gradient(v)
+        self.assertAllClose(y, np.ones((2, 3)))
+        if backend.backend() == "torch":
+            self.assertFalse(y.requires_grad)
+
+    def test_stop_gradient_non_tensor(self):
+        x = np.ones((2, 3))
+        y = ops.stop_gradient(x)
+        self.assertAllClose(y, x)
+
     def test_shape(self):
         x = np.ones((2, 3, 7, 1))
         self.assertAllEqual(core.shape(x), (2, 3, 7, 1))
@@ -302,6 +367,53 @@ class CoreOpsCorrectnessTest(testing.TestCase):
         with self.assertRaises(ValueError):
             ops.convert_to_numpy(KerasTensor((2,)))
 
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Only torch casts lists of tensors to the requested dtype.",
+    )
+    def test_convert_to_tensor_list_of_tensors_dtype(self):
+        x = ops.convert_to_tensor(
+            [ops.ones((2,), dtype="int32"), ops.zeros((2,), dtype="int32")],
+            dtype="float32",
+        )
+        self.assertIn("float32", str(x.dtype))
+        self.assertAllClose(x, [[1, 1], [0, 0]])
+
+        # Mixed list of tensors and Python scalars.
+        x = ops.convert_to_tensor(
+            [ops.array(1, dtype="int32"), 2, 3.0], dtype="float16"
+        )
+        self.assertIn("float16", str(x.dtype))
+        self.assertAllClose(x, [1, 2, 3])
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Tests parsing of nested lists holding torch tensors.",
+    )
+    def test_convert_to_tensor_nested_list_of_tensors(self):
+        import torch
+
+        a, b, c, d = [
+            torch.tensor(v, dtype=torch.float32, requires_grad=True)
+            for v in [1.0, 2.0, 3.0, 4.0]
+        ]
+        x = ops.convert_to_tensor([[a, b], [c, d]], dtype="float32")
+        self.assertAllClose(x, [[1, 2], [3, 4]])
+
+    @pytest.mark.skipif(
+        backend.backend() != "torch",
+        reason="Tests parsing of lists with non-numeric elements in torch.",
+    )
+    def test_convert_to_tensor_list_non_numeric(self):
+        with self.assertRaises((TypeError, ValueError)):
+            ops.convert_to_tensor([1.0, None])
+        with self.assertRaises((TypeError, ValueError)):
+            ops.convert_to_tensor(["1.5", "2"])
+
+        # Out-of-range values wrap around like `torch.as_tensor`.
+        x = ops.convert_to_tensor([-1], dtype="uint8")
+        self.assertAllEqual(x, [255])
+
     @pytest.mark.skipif(
         not backend.SUPPORTS_SPARSE_TENSORS,
         reason="Backend does not support sparse tensors.",